@@ -21,10 +21,28 @@ def get_root_nodes_of_type(node_type, nodes=None, search_depth=None, **kwargs):
     search_kwargs = dict(typ=node_type, long=True, dag=True, **kwargs)
     nodes_to_search = cmds.ls(nodes or "::*", **search_kwargs)
 
+    # query every node of the given type once with its exact node type so the
+    # hierarchy walk below is a pure python lookup instead of a nodeType call
+    # per dag path segment, the ::* wildcard keeps nested references included
+    # and allPaths lists every instance path to match the dag search paths
+    typed_nodes = cmds.ls(
+        "::*", typ=node_type, long=True, dag=True, allPaths=True,
+        showType=True
+    )
+    node_paths, node_types = typed_nodes[0::2], typed_nodes[1::2]
+    root_node_paths = {
+        node_path for node_path, typ in zip(node_paths, node_types)
+        if typ == node_type
+    }
+
     # convert 0 to None for list slicing and convert 1 to 2 for dag root "|"
     search_depth = search_depth or None
     search_depth = 2 if search_depth == 1 else search_depth
 
+    # cache of dag path -> root node found at or above it, sibling nodes share
+    # their ancestors so each dag path prefix only gets resolved once
+    root_node_cache = {}
+
     def _get_root_node_of_type(node_path):
         """
         Find the node in the given node path that matches the given type.
@@ -36,17 +54,26 @@ def get_root_nodes_of_type(node_type, nodes=None, search_depth=None, **kwargs):
         # the first element will be an empty sting but is needed for rebuilding
         # the dag path when the join method is ran i.e., "|node|dag|path" vs
         # "node|dag|path", the latter being invalid without the trailing "|"
-        node_hierarchy = node_path.split("|")[:search_depth]
-
-        # set enumerate to start on 1 so the node index is the joint
-        # node not it's parent node in the hierarchy and return the joined
-        # dag path on the first occurrence of a node in the hierarchy that
-        # matches the given node type
-        for node_index, node in enumerate(node_hierarchy, 1):
-            if node and cmds.nodeType(node) == node_type:
-                
-                # return the full dag path to the matching node
-                return "|".join(node_hierarchy[:node_index])
+        dag_path = "|".join(node_path.split("|")[:search_depth])
+
+        # walk up the hierarchy until reaching a dag path that has already
+        # been resolved, rpartition of the top level node returns "" and ends
+        # the walk at the dag root
+        unresolved_paths = []
+        while dag_path and dag_path not in root_node_cache:
+            unresolved_paths.append(dag_path)
+            dag_path = dag_path.rpartition("|")[0]
+        root_node = root_node_cache.get(dag_path)
+
+        # resolve the remaining paths top down so the first occurrence of a
+        # node in the hierarchy that matches the given node type is the root
+        for unresolved_path in reversed(unresolved_paths):
+            if root_node is None and unresolved_path in root_node_paths:
+                root_node = unresolved_path
+            root_node_cache[unresolved_path] = root_node
+
+        # return the full dag path to the matching node
+        return root_node
 
     # use map built-in method for iteration speed
     nodes_map = map(_get_root_node_of_type, nodes_to_search)
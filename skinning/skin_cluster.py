@@ -1,5 +1,4 @@
 
-from maya import cmds
 from maya.api import OpenMaya, OpenMayaAnim
 
 
@@ -7,6 +6,13 @@ class BaseSkinCluster:
 
     def __init__(self, mesh):
         self._mesh = mesh
+
+        # cached maya queries, see clear_cache
+        self._skin_cluster = None
+        self._skin_cluster_object = None
+        self._output_geometry = None
+        self._mesh_dag_path_object = None
+        self._influence_objects = None
         self._influence_indexes = None
 
         single_index_component = OpenMaya.MFnSingleIndexedComponent()
@@ -21,6 +27,19 @@ class BaseSkinCluster:
     @mesh.setter
     def mesh(self, mesh):
         self._mesh = mesh
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Clears the cached skinCluster queries so they are rebuilt from the
+        scene on next access, e.g., after the skinCluster has been recreated.
+        """
+        self._skin_cluster = None
+        self._skin_cluster_object = None
+        self._output_geometry = None
+        self._mesh_dag_path_object = None
+        self._influence_objects = None
+        self._influence_indexes = None
 
     @property
     def skin_cluster(self):
@@ -30,9 +49,53 @@ class BaseSkinCluster:
         :return: Returns the skinCluster from the mesh.
         :rtype: str
         """
-        history = cmds.listHistory(self.mesh, pruneDagObjects=True)
-        skin_cluster = cmds.ls(history, type="skinCluster")
-        return skin_cluster[0] if skin_cluster else ""
+        if self._skin_cluster is None:
+            # walk upstream from the mesh shape and stop on the first
+            # skinCluster rather than listing the entire mesh history, the
+            # walk is unfiltered so other dag nodes can be pruned the same as
+            # listHistory pruneDagObjects, otherwise it passes through driver
+            # meshes and joints into skinClusters that don't deform this mesh
+            shape_object = self._get_shape_object()
+            history_iterator = OpenMaya.MItDependencyGraph(
+                shape_object,
+                OpenMaya.MFn.kInvalid,  # no type filter
+                OpenMaya.MItDependencyGraph.kUpstream,
+                OpenMaya.MItDependencyGraph.kBreadthFirst
+            )
+
+            # only cache a found skinCluster so a mesh that gets bound after
+            # this instance was created is found on the next access
+            while not history_iterator.isDone():
+                node = history_iterator.currentNode()
+                if node.hasFn(OpenMaya.MFn.kSkinClusterFilter):
+                    dependency_node = OpenMaya.MFnDependencyNode(node)
+                    self._skin_cluster = dependency_node.name()
+                    break
+
+                if node.hasFn(OpenMaya.MFn.kDagNode) and node != shape_object:
+                    history_iterator.prune()
+                history_iterator.next()
+
+        return self._skin_cluster or ""
+
+    def _get_shape_object(self):
+        """
+        Gets the shape node of the mesh, resolving a transform to its first
+        non-intermediate shape, e.g., skipping the orig shape of a skin.
+
+        :return: Returns the shape node of the mesh.
+        :rtype: OpenMaya.MObject
+        """
+        selection_list = OpenMaya.MGlobal.getSelectionListByName(self.mesh)
+        dag_path = selection_list.getDagPath(0)
+
+        for shape_index in range(dag_path.numberOfShapesDirectlyBelow()):
+            shape_path = OpenMaya.MDagPath(dag_path)
+            shape_path.extendToShape(shape_index)
+            if not OpenMaya.MFnDagNode(shape_path).isIntermediateObject:
+                return shape_path.node()
+
+        return dag_path.node()
 
     @property
     def skin_cluster_object(self):
@@ -42,9 +105,13 @@ class BaseSkinCluster:
         :return: Returns the MFnSkinCluster object from the skinCluster.
         :rtype: OpenMayaAnim.MFnSkinCluster
         """
-        selection_list = OpenMaya.MGlobal.getSelectionListByName(self.skin_cluster)
-        mobject = selection_list.getDependNode(0)
-        return OpenMayaAnim.MFnSkinCluster(mobject)
+        if self._skin_cluster_object is None:
+            selection_list = OpenMaya.MGlobal.getSelectionListByName(
+                self.skin_cluster
+            )
+            mobject = selection_list.getDependNode(0)
+            self._skin_cluster_object = OpenMayaAnim.MFnSkinCluster(mobject)
+        return self._skin_cluster_object
 
     @property
     def output_geometry(self):
@@ -54,9 +121,11 @@ class BaseSkinCluster:
         :return: Returns the output geometry object from the skinCluster.
         :rtype: str
         """
-        output_geometry = self.skin_cluster_object.getOutputGeometry()
-        dag_node = OpenMaya.MFnDagNode(output_geometry[0])
-        return dag_node.fullPathName()
+        if self._output_geometry is None:
+            output_geometry = self.skin_cluster_object.getOutputGeometry()
+            dag_node = OpenMaya.MFnDagNode(output_geometry[0])
+            self._output_geometry = dag_node.fullPathName()
+        return self._output_geometry
 
     @property
     def mesh_dag_path_object(self):
@@ -66,10 +135,12 @@ class BaseSkinCluster:
         :return: Returns the MFnSkinCluster object from the skinCluster.
         :rtype: OpenMaya.MDagPath
         """
-        selection_list = OpenMaya.MGlobal.getSelectionListByName(
-            self.output_geometry
-        )
-        return selection_list.getDagPath(0)
+        if self._mesh_dag_path_object is None:
+            selection_list = OpenMaya.MGlobal.getSelectionListByName(
+                self.output_geometry
+            )
+            self._mesh_dag_path_object = selection_list.getDagPath(0)
+        return self._mesh_dag_path_object
 
     @property
     def influence_indexes(self):
@@ -79,15 +150,11 @@ class BaseSkinCluster:
         :return: Returns the influence indexes for the skinCluster.
         :rtype: OpenMaya.MIntArray
         """
-        self._influence_indexes = OpenMaya.MIntArray(
-            self.number_of_influences,
-            0  # initial value of each index
-        )
-
-        # build up the influence indexes
-        for influence_index in range(self.number_of_influences):
-            self._influence_indexes[influence_index] = influence_index
-
+        # build up the influence indexes in a single constructor call
+        if self._influence_indexes is None:
+            self._influence_indexes = OpenMaya.MIntArray(
+                list(range(self.number_of_influences))
+            )
         return self._influence_indexes
 
     @property
@@ -98,7 +165,11 @@ class BaseSkinCluster:
         :return: Returns influence objects on the skinCluster.
         :rtype: OpenMaya.MDagPathArray
         """
-        return self.skin_cluster_object.influenceObjects()
+        if self._influence_objects is None:
+            self._influence_objects = (
+                self.skin_cluster_object.influenceObjects()
+            )
+        return self._influence_objects
 
     @property
     def number_of_influences(self):